@@ -14,7 +14,7 @@ CHANGES FROM v2 (AUC=0.506 → targeting 0.52+):
 
   Input:  datasets/autogluon/mes_lean_fred_indexes_2020plus.csv
   Output: models/core_forecaster/{1h,4h,1d,1w}/fold_N/   (AutoGluon artifacts)
-          datasets/autogluon/core_oof_1h.csv               (OOF predictions)
+          datasets/autogluon/core_oof_1h.parquet           (OOF predictions, zstd; + .csv with --legacy-csv)
           models/reports/feature_importance.md              (TradingView setup guide)
           models/reports/v2_validation.md                   (validation report)
           models/logs/training_final_YYYYMMDD.log
@@ -28,20 +28,25 @@ CHANGES FROM v2 (AUC=0.506 → targeting 0.52+):
   Time:   ~20 hours on Apple Silicon (5 folds x 4 horizons x 3600s)
 """
 
-import sys, os, warnings, shutil, json, hashlib, random, pickle
+import sys, os, warnings, shutil, json, hashlib, random, pickle, atexit, contextlib
 import argparse
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
-from scipy.stats import spearmanr
+from concurrent.futures import ThreadPoolExecutor
+from joblib import Parallel, delayed
+from scipy.stats import spearmanr, rankdata, t as student_t
 from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.spatial.distance import squareform
 from sklearn.metrics import roc_auc_score, accuracy_score, brier_score_loss
 from sklearn.isotonic import IsotonicRegression
 from sklearn.linear_model import LogisticRegression
 
+try:
+    import numba as nb
+except ImportError:  # optional: ECE falls back to NumPy bincount
+    nb = None
+
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 # ─── Paths ────────────────────────────────────────────────────────────────────
@@ -49,7 +54,7 @@ warnings.filterwarnings("ignore", category=FutureWarning)
 ROOT = Path(__file__).resolve().parent.parent
 DATASET_DEFAULT = ROOT / "datasets" / "autogluon" / "mes_lean_fred_indexes_2020plus.csv"
 MODEL_DIR = ROOT / "models" / "core_forecaster"
-OOF_OUTPUT = ROOT / "datasets" / "autogluon" / "core_oof_1h.csv"
+OOF_OUTPUT = ROOT / "datasets" / "autogluon" / "core_oof_1h.parquet"
 REPORT_DIR = ROOT / "models" / "reports"
 LOG_DIR = ROOT / "models" / "logs"
 
@@ -74,6 +79,8 @@ MIN_COVERAGE = 0.50            # drop features with <50% non-null
 MAX_FEATURES = 50              # IC screening: keep top N per fold
 CORR_THRESHOLD = 0.90          # hierarchical cluster dedup threshold
 FEATURE_MAX_LOOKBACK = 24      # longest rolling window in feature engineering (24h)
+FI_SUBSAMPLE_ROWS = 5000       # permutation importance: max val rows scored per shuffle
+FI_SHUFFLE_SETS = 5            # permutation importance: shuffles per feature
 
 
 def parse_args():
@@ -100,11 +107,27 @@ def parse_args():
         default=None,
         help="Override number of walk-forward folds (default: 5).",
     )
+    parser.add_argument(
+        "--fold-jobs",
+        type=int,
+        default=None,
+        help="Walk-forward folds trained in parallel (default: CPUs // NUM_BAG_FOLDS, capped at fold count). 1 = sequential.",
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
         help="Delete existing fold directories before training.",
     )
+    parser.add_argument(
+        "--legacy-csv",
+        action="store_true",
+        help="Also write the OOF table as CSV next to the parquet file (for older consumers).",
+    )
+    parser.add_argument(
+        "--verify-calibration",
+        action="store_true",
+        help="Cross-check the single-sort OOF AUCs against roc_auc_score.",
+    )
     parser.add_argument(
         "--preflight-only",
         action="store_true",
@@ -204,6 +227,22 @@ FEATURE_TV_MAP = {
 }
 
 
+def _tv_category(chart):
+    """Report section for a FEATURE_TV_MAP chart string (SKIP = not shown)."""
+    if "WATCHLIST" in chart:
+        return "WATCHLIST"
+    if "DASHBOARD" in chart:
+        return "DASHBOARD"
+    if "CALENDAR" in chart:
+        return "CALENDAR"
+    return "CHART" if chart != "N/A" else "SKIP"
+
+
+# Categorized once at import; generate_tv_report only does dict lookups
+_TV_CATEGORY = {f: _tv_category(e.get("chart", "")) for f, e in FEATURE_TV_MAP.items()}
+_TV_ROWS = {f: {"feature": f, **e} for f, e in FEATURE_TV_MAP.items()}
+
+
 # ─── Reproducibility ─────────────────────────────────────────────────────────
 
 def set_all_seeds(seed):
@@ -237,30 +276,149 @@ def compute_purge_embargo(horizon_bars, feature_max_lookback=24):
 
 # ─── ECE with Quantile Bins ──────────────────────────────────────────────────
 
-def expected_calibration_error(y_true, y_prob, n_bins=10):
-    """ECE with equal-frequency (quantile) bins for robust tail estimation."""
-    bin_edges = np.quantile(y_prob, np.linspace(0, 1, n_bins + 1))
+if nb is not None:
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _ece_kernel(y_true, y_prob, bin_edges, n_chunks):
+        """Per-bin (count, sum_y, sum_p): per-chunk accumulators, then reduce."""
+        n = y_prob.shape[0]
+        n_bins = bin_edges.shape[0] - 1
+        counts = np.zeros((n_chunks, n_bins))
+        sum_y = np.zeros((n_chunks, n_bins))
+        sum_p = np.zeros((n_chunks, n_bins))
+        chunk = (n + n_chunks - 1) // n_chunks
+        for c in nb.prange(n_chunks):
+            stop = min((c + 1) * chunk, n)
+            for i in range(c * chunk, stop):
+                b = np.searchsorted(bin_edges, y_prob[i], side="right") - 1
+                if b < 0 or b >= n_bins:
+                    continue
+                counts[c, b] += 1.0
+                sum_y[c, b] += y_true[i]
+                sum_p[c, b] += y_prob[i]
+        return counts.sum(axis=0), sum_y.sum(axis=0), sum_p.sum(axis=0)
+
+
+def _ece_bin_stats(y_true, y_prob, bin_edges):
+    """Per-bin (count, sum_y, sum_p) for half-open bins [edge_i, edge_i+1)."""
+    y_true = np.ascontiguousarray(y_true, dtype=np.float64)
+    y_prob = np.ascontiguousarray(y_prob, dtype=np.float64)
+    if nb is not None and len(y_prob) > 0:
+        n_chunks = max(1, min(nb.get_num_threads(), len(y_prob)))
+        return _ece_kernel(y_true, y_prob, bin_edges, n_chunks)
+
+    n_bins = len(bin_edges) - 1
+    bins = np.searchsorted(bin_edges, y_prob, side="right") - 1
+    valid = (bins >= 0) & (bins < n_bins)
+    bins = bins[valid]
+    counts = np.bincount(bins, minlength=n_bins).astype(np.float64)
+    sum_y = np.bincount(bins, weights=y_true[valid], minlength=n_bins)
+    sum_p = np.bincount(bins, weights=y_prob[valid], minlength=n_bins)
+    return counts, sum_y, sum_p
+
+
+def _quantile_edges(y_sorted, n_bins):
+    """np.quantile(method='linear') bin edges, read directly off a sorted array."""
+    pos = np.linspace(0, 1, n_bins + 1) * (len(y_sorted) - 1)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, len(y_sorted) - 1)
+    t = pos - lo
+    a, b = y_sorted[lo], y_sorted[hi]
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def expected_calibration_error(y_true, y_prob, n_bins=10, y_prob_sorted=None):
+    """ECE with equal-frequency (quantile) bins for robust tail estimation.
+
+    Pass y_prob_sorted (np.sort(y_prob)) when calling repeatedly on the same
+    probabilities, e.g. sweeping n_bins, so the sort happens once.
+    Bin aggregation runs in a Numba kernel when numba is installed, otherwise
+    a NumPy searchsorted + bincount fallback.
+    """
+    if y_prob_sorted is None:
+        y_prob_sorted = np.sort(y_prob)
+    bin_edges = _quantile_edges(y_prob_sorted, n_bins)
     bin_edges[-1] += 1e-8
+    counts, sum_y, sum_p = _ece_bin_stats(y_true, y_prob, bin_edges)
     ece = 0.0
     reliability = []
     for i in range(n_bins):
-        mask = (y_prob >= bin_edges[i]) & (y_prob < bin_edges[i + 1])
-        if mask.sum() == 0:
+        if counts[i] == 0:
             continue
-        bin_acc = y_true[mask].mean()
-        bin_conf = y_prob[mask].mean()
-        weight = mask.sum() / len(y_true)
+        bin_acc = sum_y[i] / counts[i]
+        bin_conf = sum_p[i] / counts[i]
+        weight = counts[i] / len(y_true)
         ece += weight * abs(bin_acc - bin_conf)
         reliability.append({
             "bin_lower": float(bin_edges[i]),
             "bin_upper": float(bin_edges[i + 1]),
             "actual_freq": float(bin_acc),
             "predicted_mean": float(bin_conf),
-            "count": int(mask.sum()),
+            "count": int(counts[i]),
         })
     return ece, reliability
 
 
+# ─── Spearman IC for Binary Targets ──────────────────────────────────────────
+
+def binary_spearman(y, p):
+    """Spearman (rho, p-value) of a 0/1 target against scores, one ranking pass.
+
+    Ranks of a binary y are an affine map of y itself, so rho is the Pearson
+    correlation of y with rank(p), in closed form:
+    (mean rank | y=1 - mean rank) * sqrt(n1 / n0) / std(rank).
+    The p-value uses the same t-approximation as scipy.stats.spearmanr.
+    """
+    y = np.asarray(y) == 1
+    r = rankdata(p)
+    n, n1 = len(r), int(y.sum())
+    n0 = n - n1
+    r_std = r.std()
+    if n < 3 or n1 == 0 or n0 == 0 or r_std == 0:
+        return float("nan"), float("nan")
+    rho = float((r[y].mean() - r.mean()) * np.sqrt(n1 / n0) / r_std)
+    rho = min(1.0, max(-1.0, rho))
+    if abs(rho) == 1.0:
+        return rho, 0.0  # perfect separation; scipy reports p = 0
+    t_stat = rho * np.sqrt((n - 2) / ((1.0 + rho) * (1.0 - rho)))
+    pval = float(2 * student_t.sf(abs(t_stat), n - 2))
+    return rho, pval
+
+
+# ─── Raw + Calibrated OOF AUC from One Sort ─────────────────────────────────
+
+def _sorted_auc(y_sorted, s_sorted):
+    """Tie-aware rank-sum AUC for scores already sorted ascending."""
+    n = len(s_sorted)
+    n1 = int(y_sorted.sum())
+    n0 = n - n1
+    starts = np.flatnonzero(np.r_[True, s_sorted[1:] != s_sorted[:-1]])
+    ends = np.r_[starts[1:], n]
+    ranks = np.repeat((starts + ends + 1) / 2.0, ends - starts)
+    return float((ranks[y_sorted].sum() - n1 * (n1 + 1) / 2) / (n1 * n0))
+
+
+def oof_auc_pair(y, raw, cal):
+    """(raw AUC, calibrated AUC) sharing a single argsort of the raw scores.
+
+    Isotonic and positive-slope Platt maps are non-decreasing, so the raw sort
+    order also sorts the calibrated scores and their (new) ties stay contiguous.
+    Falls back to roc_auc_score when the calibrated scores are not monotone in
+    the raw ones (e.g. a negative Platt slope).
+    """
+    if len(np.unique(y)) < 2:
+        return roc_auc_score(y, raw), roc_auc_score(y, cal)
+    order = np.argsort(raw, kind="stable")
+    y_sorted = np.asarray(y)[order] == 1
+    auc_raw = _sorted_auc(y_sorted, np.asarray(raw)[order])
+    cal_sorted = np.asarray(cal)[order]
+    if np.all(cal_sorted[1:] >= cal_sorted[:-1]):
+        auc_cal = _sorted_auc(y_sorted, cal_sorted)
+    else:
+        auc_cal = roc_auc_score(y, cal)
+    return auc_raw, auc_cal
+
+
 # ─── Feature Selection by Information Coefficient ────────────────────────────
 
 def rank_features_by_ic(train_df, feature_cols, target_col, top_n=50):
@@ -313,12 +471,10 @@ def cluster_dedup_features(df, feature_cols, target_col, threshold=0.90):
         ic, _ = spearmanr(valid[col], valid[target_col])
         ics[col] = abs(ic) if np.isfinite(ic) else 0.0
 
-    # Distance matrix from correlation
+    # Condensed (upper-triangle) distances from correlation
     corr = df[numeric].corr(method='spearman').abs().values
-    np.fill_diagonal(corr, 1.0)
-    dist = 1 - corr
-    dist = np.clip(dist, 0, 2)
-    condensed = squareform(dist, checks=False)
+    iu = np.triu_indices(len(numeric), k=1)
+    condensed = np.clip(1 - corr[iu], 0, 2)
 
     # Hierarchical clustering (average linkage)
     Z = linkage(condensed, method='average')
@@ -355,19 +511,234 @@ def walk_forward_splits(n, n_folds, purge, embargo):
     return splits
 
 
+# ─── Walk-Forward Fold Training ──────────────────────────────────────────────
+
+def _positive_class_idx(class_labels, pos_label=1):
+    """Column position of P(pos_label) in predict_proba output (int or str label)."""
+    labels = list(class_labels)
+    for cand in (pos_label, str(pos_label)):
+        if cand in labels:
+            return labels.index(cand)
+    raise ValueError(f"Positive label {pos_label!r} not in class labels {labels}")
+
+
+def _train_fold(fold_i, n_splits, train_idx, val_idx, h_df, h_name, feature_cols, target_col,
+                col_pos, time_limit, purge, embargo, num_cpus="auto", max_memory_ratio=1.5,
+                pos_col_idx=None):
+    """Train and evaluate one walk-forward fold in its own fold_dir.
+
+    pos_col_idx is the P(class=1) column resolved by an earlier fold of the
+    same horizon (None = resolve from predictor.class_labels).
+    Returns None when the fold is skipped, otherwise a dict with the OOF
+    predictions (by h_df row), fold metrics, importance and selected features.
+    """
+    from autogluon.tabular import TabularPredictor
+
+    set_all_seeds(SEED)  # same RNG state per fold whether run in-process or in a loky worker
+    print(f"\n  ── Fold {fold_i + 1}/{n_splits} ──")
+    print(f"  Train: {len(train_idx):,}  |  Val: {len(val_idx):,}")
+
+    # No per-fold dropna: h_df targets are already non-null (dropna + int8 cast per horizon)
+    base_positions = [col_pos[c] for c in feature_cols + [target_col]]
+    train_data = h_df.iloc[train_idx, base_positions]
+    val_data = h_df.iloc[val_idx, base_positions]
+
+    if len(train_data) < 100 or len(val_data) < 10:
+        print(f"    SKIP: insufficient data")
+        return None
+
+    # ── Per-fold IC screening ──
+    fold_features = rank_features_by_ic(
+        train_data, feature_cols, target_col, top_n=MAX_FEATURES
+    )
+    print(f"    Using {len(fold_features)} features for this fold")
+
+    # Subset data to selected features (h_df index == row position after reset_index)
+    fold_positions = np.fromiter((col_pos[c] for c in fold_features + [target_col]), dtype=np.int64)
+    train_subset = h_df.iloc[train_data.index.to_numpy(), fold_positions]
+    val_subset = h_df.iloc[val_data.index.to_numpy(), fold_positions]
+
+    fold_dir = MODEL_DIR / h_name / f"fold_{fold_i}"
+    fold_dir.mkdir(parents=True, exist_ok=True)
+
+    predictor = TabularPredictor(
+        label=target_col,
+        path=str(fold_dir),
+        problem_type="binary",
+        eval_metric=EVAL_METRIC,
+        verbosity=2,
+    )
+
+    predictor.fit(
+        train_data=train_subset,
+        time_limit=time_limit,
+        presets=PRESETS,
+        num_cpus=num_cpus,
+        num_gpus=0,
+        excluded_model_types=EXCLUDED,
+        num_bag_folds=NUM_BAG_FOLDS,
+        num_stack_levels=NUM_STACK_LEVELS,
+        dynamic_stacking=False,
+        ag_args_fit={
+            "num_early_stopping_rounds": 50,
+            "ag.max_memory_usage_ratio": max_memory_ratio,
+        },
+        ag_args_ensemble={
+            "fold_fitting_strategy": "sequential_local",
+        },
+    )
+
+    # Leaderboard
+    lb = predictor.leaderboard(val_subset, silent=True)
+    print(f"\n    Leaderboard (top 5):")
+    print(lb.head(5).to_string())
+
+    # Predictions — extract P(class=1) by column position
+    if pos_col_idx is None:
+        pos_col_idx = _positive_class_idx(predictor.class_labels)
+    preds_np = predictor.predict_proba(val_subset[fold_features], as_multiclass=True).to_numpy()[:, pos_col_idx]
+
+    # Guardrails
+    assert 0 <= preds_np.min() and preds_np.max() <= 1, \
+        f"Probs out of [0,1]: {preds_np.min():.4f}-{preds_np.max():.4f}"
+
+    if fold_i == 0:
+        base = val_subset[target_col].mean()
+        pred_mean = preds_np.mean()
+        print(f"    base_rate={base:.4f}, pred_mean={pred_mean:.4f}")
+        if abs(pred_mean - (1 - base)) < abs(pred_mean - base):
+            print(f"    WARNING: POSSIBLE PROBABILITY INVERSION!")
+
+    # Fold metrics
+    actuals = val_subset[target_col].values
+    fold_auc = roc_auc_score(actuals, preds_np)
+    fold_acc = accuracy_score(actuals, (preds_np >= 0.5).astype(int))
+    fold_ic, _ = binary_spearman(actuals, preds_np)
+    fold_brier = brier_score_loss(actuals, preds_np)
+    fold_ece, _ = expected_calibration_error(actuals, preds_np)
+    print(f"\n    AUC: {fold_auc:.4f}  Acc: {fold_acc:.4f}  IC: {fold_ic:.4f}  Brier: {fold_brier:.4f}  ECE: {fold_ece:.4f}")
+
+    metrics = {
+        "fold": fold_i,
+        "auc": float(fold_auc),
+        "acc": float(fold_acc),
+        "ic": float(fold_ic),
+        "brier": float(fold_brier),
+        "ece": float(fold_ece),
+        "n_val": len(val_data),
+    }
+
+    # Feature importance (permutation-based)
+    imp = None
+    try:
+        imp = predictor.feature_importance(
+            val_subset,
+            features=fold_features,
+            subsample_size=min(len(val_subset), FI_SUBSAMPLE_ROWS),
+            num_shuffle_sets=FI_SHUFFLE_SETS,
+            silent=True,
+        )
+        top10 = imp.head(10)
+        print(f"    Top 10 features:")
+        for feat, row in top10.iterrows():
+            tv = FEATURE_TV_MAP.get(feat, {}).get("indicator", "")
+            tag = f" -> {tv}" if tv else ""
+            print(f"      {feat:<35} {row['importance']:.4f}{tag}")
+    except Exception as e:
+        print(f"    Feature importance failed: {e}")
+
+    # Save fold metadata
+    fold_meta = {
+        "horizon": h_name,
+        "fold": fold_i,
+        "n_train": len(train_data),
+        "n_val": len(val_data),
+        "n_features": len(fold_features),
+        "features": fold_features,
+        "auc": float(fold_auc),
+        "acc": float(fold_acc),
+        "ic": float(fold_ic),
+        "brier": float(fold_brier),
+        "ece": float(fold_ece),
+        "purge": purge,
+        "embargo": embargo,
+    }
+    (fold_dir / "fold_meta.json").write_text(json.dumps(fold_meta, indent=2))
+
+    return {
+        "fold": fold_i,
+        "val_index": val_data.index.to_numpy(),
+        "preds": preds_np,
+        "metrics": metrics,
+        "importance": imp,
+        "features": fold_features,
+        "pos_col_idx": pos_col_idx,
+    }
+
+
+def _run_captured(log_path, fn, *args, **kwargs):
+    """Run fn in a parallel worker with all of its output sent to log_path.
+
+    stdout, stderr and AutoGluon's logging stream handlers (bound to the
+    worker's own stderr) are pointed at a line-buffered file, so a running
+    fold can be followed with `tail -f`. Returns (log_text, result).
+    """
+    import logging
+    import autogluon.tabular  # noqa: F401 — installs AutoGluon's stream handler before re-pointing it
+
+    handlers = [h for name in ("autogluon", "") for h in logging.getLogger(name).handlers
+                if type(h) is logging.StreamHandler]
+    prev_streams = [h.stream for h in handlers]
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "w", buffering=1) as f:
+        for h in handlers:
+            h.setStream(f)
+        try:
+            with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+                result = fn(*args, **kwargs)
+        finally:
+            for h, stream in zip(handlers, prev_streams):
+                h.setStream(stream)
+    return log_path.read_text(), result
+
+
 # ─── Log Tee ──────────────────────────────────────────────────────────────────
 
 class _Tee:
-    """Multiplex writes to several streams (stdout + log file)."""
+    """Multiplex writes to several streams (stdout + log file).
+
+    Writes are batched and handed to the streams on newline or once the
+    pending buffer exceeds FLUSH_CHARS; the streams themselves are only
+    flushed on an explicit flush() (and at interpreter exit).
+    """
+
+    FLUSH_CHARS = 4096
 
     def __init__(self, *streams):
         self.streams = streams
+        self._pending = []
+        self._pending_len = 0
+        atexit.register(self.flush)
     def write(self, data):
+        self._pending.append(data)
+        self._pending_len += len(data)
+        if "\n" in data or self._pending_len > self.FLUSH_CHARS:
+            self._drain()
+        return len(data)
+    def _drain(self):
+        if not self._pending:
+            return
+        chunk = "".join(self._pending)
+        self._pending.clear()
+        self._pending_len = 0
         for s in self.streams:
-            s.write(data); s.flush()
+            if not s.closed:
+                s.write(chunk)
     def flush(self):
+        self._drain()
         for s in self.streams:
-            s.flush()
+            if not s.closed:
+                s.flush()
     def isatty(self):
         return False
 
@@ -391,29 +762,22 @@ def generate_tv_report(importance_by_horizon, report_path):
         lines.append(f"## {horizon.upper()} Horizon — Top Features")
         lines.append("")
 
-        tv_indicators = []
-        watchlist = []
-        dashboard_only = []
-        calendar = []
+        sections = {"CHART": [], "WATCHLIST": [], "DASHBOARD": [], "CALENDAR": [], "SKIP": []}
         unmapped = []
 
         for feat, score in zip(imp_df.index, imp_df["importance"]):
             if score <= 0:
                 continue
-            entry = FEATURE_TV_MAP.get(feat)
-            if entry is None:
+            category = _TV_CATEGORY.get(feat)
+            if category is None:
                 unmapped.append((feat, score))
                 continue
-            row = {"feature": feat, "score": score, **entry}
-            chart = entry.get("chart", "")
-            if "WATCHLIST" in chart:
-                watchlist.append(row)
-            elif "DASHBOARD" in chart:
-                dashboard_only.append(row)
-            elif "CALENDAR" in chart:
-                calendar.append(row)
-            elif chart != "N/A":
-                tv_indicators.append(row)
+            sections[category].append({**_TV_ROWS[feat], "score": score})
+
+        tv_indicators = sections["CHART"]
+        watchlist = sections["WATCHLIST"]
+        dashboard_only = sections["DASHBOARD"]
+        calendar = sections["CALENDAR"]
 
         if tv_indicators:
             lines.append("### PUT ON YOUR TRADINGVIEW CHARTS")
@@ -603,7 +967,7 @@ def main():
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = LOG_DIR / f"training_final_{ts}.log"
-    log_file = open(log_path, "w", buffering=1)
+    log_file = open(log_path, "w", buffering=8192)
     sys.stdout = _Tee(sys.__stdout__, log_file)
     sys.stderr = _Tee(sys.__stderr__, log_file)
     print(f"Log: {log_path}\n")
@@ -630,13 +994,16 @@ def main():
 
     # ── Dataset quality gates (preflight) ──
     print(f"\n  Preflight quality gates:")
+    # One vectorized notna pass over every required column, then per-group lookups
+    all_required = sorted({c for cols in REQUIRED_GROUPS.values() for c in cols if c in df.columns})
+    coverage = df[all_required].notna().mean()
     for group, cols in REQUIRED_GROUPS.items():
-        present = [c for c in cols if c in df.columns]
+        present = [c for c in cols if c in coverage.index]
         if not present:
             print(f"  ABORT: Feature group '{group}' has no columns in dataset")
             print(f"         Expected: {cols}")
             sys.exit(1)
-        avg_cov = np.mean([df[c].notna().mean() for c in present])
+        avg_cov = coverage.reindex(present).mean()
         status = "PASS" if avg_cov >= MIN_GROUP_COVERAGE else "FAIL"
         print(f"    {status}: {group:<25} {len(present)}/{len(cols)} cols, coverage={avg_cov:.1%}")
         if avg_cov < MIN_GROUP_COVERAGE:
@@ -651,17 +1018,26 @@ def main():
         dir_col = f"target_dir_{h_name}"
         ret_col = f"target_ret_{h_name}"
 
-        if dir_col not in df.columns and "target" in df.columns:
+        need_dir = dir_col not in df.columns
+        need_ret = ret_col not in df.columns
+        if "target" not in df.columns or not (need_dir or need_ret):
+            continue
+
+        # close.shift(-horizon_bars) as a raw array, shared by both targets
+        close = df["target"].to_numpy(dtype=np.float64)
+        future = np.full(len(close), np.nan)
+        if horizon_bars < len(close):
+            future[:len(close) - horizon_bars] = close[horizon_bars:]
+        valid = ~np.isnan(future)
+
+        if need_dir:
             print(f"  Creating {h_name} target (close.shift(-{horizon_bars}) vs close)...")
-            future = df["target"].shift(-horizon_bars)
-            df[dir_col] = (future > df["target"]).astype(float)
-            df.loc[future.isna(), dir_col] = np.nan
-            print(f"    {dir_col}: {df[dir_col].notna().sum():,} valid rows")
+            df[dir_col] = np.where(valid, (future > close).astype(np.float32), np.nan).astype(np.float32)
+            print(f"    {dir_col}: {int(valid.sum()):,} valid rows")
 
-        if ret_col not in df.columns and "target" in df.columns:
-            future = df["target"].shift(-horizon_bars)
-            df[ret_col] = (future - df["target"]) / df["target"]
-            df.loc[future.isna(), ret_col] = np.nan
+        if need_ret:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                df[ret_col] = np.where(valid, (future - close) / close, np.nan)
 
     # Feature columns = everything except identity + targets
     feature_cols = [c for c in df.columns if c not in DROP_COLS]
@@ -671,32 +1047,50 @@ def main():
     assert not leaked, f"TARGET LEAK: {leaked}"
 
     # ── Drop sparse features (<50% non-null) ──
-    sparse = [(c, df[c].notna().mean()) for c in feature_cols if df[c].notna().mean() < MIN_COVERAGE]
-    if sparse:
-        print(f"\n  Dropping {len(sparse)} sparse features (<{MIN_COVERAGE:.0%} non-null):")
-        for col, cov in sparse:
-            print(f"    {col:<40} {cov:.1%}")
-        feature_cols = [c for c in feature_cols if c not in {s[0] for s in sparse}]
+    # Coverage computed once for every feature in a single reduction
+    cov = df[feature_cols].notna().mean().to_numpy()
+    sparse_mask = cov < MIN_COVERAGE
+    if sparse_mask.any():
+        names = np.array(feature_cols, dtype=object)
+        print(f"\n  Dropping {int(sparse_mask.sum())} sparse features (<{MIN_COVERAGE:.0%} non-null):")
+        for col, col_cov in zip(names[sparse_mask], cov[sparse_mask]):
+            print(f"    {col:<40} {col_cov:.1%}")
+        feature_cols = names[~sparse_mask].tolist()
 
     # ── Replace inf, winsorize outliers ──
     numeric = df[feature_cols].select_dtypes(include=[np.number]).columns.tolist()
-    n_inf = sum((~np.isfinite(df[c].fillna(0))).sum() for c in numeric)
+    arr = df[numeric].to_numpy(dtype=np.float64)
+    inf_mask = np.isinf(arr)
+    n_inf = int(inf_mask.sum())
     if n_inf > 0:
         print(f"  Replacing {n_inf} inf values with NaN")
-        df[numeric] = df[numeric].replace([np.inf, -np.inf], np.nan)
-
+        # Only columns that actually hold inf are rewritten (int columns keep their dtype)
+        inf_cols = inf_mask.any(axis=0)
+        df[[c for c, hit in zip(numeric, inf_cols) if hit]] = np.where(inf_mask[:, inf_cols], np.nan, arr[:, inf_cols])
+    del arr, inf_mask
+
+    # One nanquantile + clip over the non-constant numeric block; only clipped columns are written back.
+    # Constant / all-NaN columns (ptp == 0 or NaN) can never be clipped, so they skip the partition.
+    arr = df[numeric].to_numpy(dtype=np.float64)
+    col_ptp = np.nanmax(arr, axis=0) - np.nanmin(arr, axis=0)
+    active = np.flatnonzero(col_ptp > 0)
     winsorized = 0
-    for col in numeric:
-        if col in feature_cols:
-            p01, p99 = df[col].quantile(0.01), df[col].quantile(0.99)
-            if p01 == p99:
-                continue
-            clipped = df[col].clip(lower=p01, upper=p99)
-            if (df[col] != clipped).sum() > 0:
-                df[col] = clipped
-                winsorized += 1
+    if active.size:
+        sub = arr[:, active]
+        p01, p99 = np.nanquantile(sub, [0.01, 0.99], axis=0)
+        clipped = np.clip(sub, p01, p99)
+        changed = ((sub != clipped) & ~np.isnan(sub)).any(axis=0) & (p01 != p99)
+        winsorized = int(changed.sum())
+        if winsorized:
+            df[[numeric[i] for i in active[changed]]] = clipped[:, changed]
+        del sub, clipped
+    del arr
     print(f"  Winsorized {winsorized} features to [1st, 99th] percentile")
 
+    # float64 → float32 features: half the bytes through every fold, IC screen and fit
+    float_cols = df[numeric].select_dtypes(include=[np.float64]).columns
+    df[float_cols] = df[float_cols].astype(np.float32)
+
     # ── Global hierarchical correlation dedup ──
     # Use first available target for IC computation during dedup
     dedup_target = None
@@ -723,18 +1117,21 @@ def main():
 
     if args.preflight_only:
         print("  Preflight-only mode: checks passed, no training started.")
+        sys.stdout.flush()
+        sys.stderr.flush()
         log_file.close()
         sys.stdout = sys.__stdout__
         sys.stderr = sys.__stderr__
         return
 
     if args.clean:
-        for h in active_horizons:
-            for i in range(n_folds):
-                fold_dir = MODEL_DIR / h / f"fold_{i}"
-                if fold_dir.exists():
-                    shutil.rmtree(fold_dir)
-                    print(f"  [clean] Removed {fold_dir.relative_to(ROOT)}")
+        # One existence scan, then overlap the I/O-bound tree walks across folds
+        stale = [d for d in (MODEL_DIR / h / f"fold_{i}" for h in active_horizons for i in range(n_folds))
+                 if d.exists()]
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(shutil.rmtree, stale))
+        for fold_dir in stale:
+            print(f"  [clean] Removed {fold_dir.relative_to(ROOT)}")
         print()
 
     # ── OOF storage ──
@@ -764,8 +1161,10 @@ def main():
             print(f"  SKIP: target column {target_col} not in dataset")
             continue
 
-        # Per-horizon dropna
+        # Per-horizon dropna (source row positions kept for the OOF scatter back into oof_df)
+        h_src_pos = np.flatnonzero(df[target_col].notna().to_numpy())
         h_df = df.dropna(subset=[target_col]).reset_index(drop=True)
+        h_df[target_col] = h_df[target_col].astype(np.int8)
         print(f"  Rows with valid {target_col}: {len(h_df):,}")
 
         # Class balance check
@@ -781,155 +1180,71 @@ def main():
             gap = va_idx[0] - tr_idx[-1] - 1 if tr_idx and va_idx else 0
             print(f"    Fold {fi}: train={len(tr_idx):,}  val={len(va_idx):,}  gap={gap}")
 
+        # Column positions resolved once per horizon; folds slice with positional takes
+        col_pos = {c: i for i, c in enumerate(h_df.columns)}
+
         oof_preds = pd.Series(np.nan, index=h_df.index, dtype=float)
         fold_importances = []
         fold_metrics = []
-        fold_assignments = []  # track which fold each OOF row belongs to
-        feature_selection_counts = defaultdict(int)
-
-        for fold_i, (train_idx, val_idx) in enumerate(splits):
-            print(f"\n  ── Fold {fold_i + 1}/{len(splits)} ──")
-            print(f"  Train: {len(train_idx):,}  |  Val: {len(val_idx):,}")
-
-            train_data = h_df.iloc[train_idx][feature_cols + [target_col]].dropna(subset=[target_col])
-            val_data = h_df.iloc[val_idx][feature_cols + [target_col]].dropna(subset=[target_col])
-
-            if len(train_data) < 100 or len(val_data) < 10:
-                print(f"    SKIP: insufficient data")
-                continue
-
-            # ── Per-fold IC screening ──
-            fold_features = rank_features_by_ic(
-                train_data, feature_cols, target_col, top_n=MAX_FEATURES
-            )
-            print(f"    Using {len(fold_features)} features for this fold")
-
-            # Track feature stability
-            for f in fold_features:
-                feature_selection_counts[f] += 1
-
-            # Subset data to selected features
-            train_subset = train_data[fold_features + [target_col]]
-            val_subset = val_data[fold_features + [target_col]]
-
-            fold_dir = MODEL_DIR / h_name / f"fold_{fold_i}"
-            fold_dir.mkdir(parents=True, exist_ok=True)
-
-            predictor = TabularPredictor(
-                label=target_col,
-                path=str(fold_dir),
-                problem_type="binary",
-                eval_metric=EVAL_METRIC,
-                verbosity=2,
+        fold_id_arr = np.full(len(h_df), -1, dtype=np.int32)  # fold of each OOF row
+        feat_id = {f: i for i, f in enumerate(feature_cols)}
+        selected_ids = []  # feature ids selected per fold, flattened across folds
+
+        # ── Walk-forward folds (independent predictors → run in parallel) ──
+        fold_jobs = args.fold_jobs or (os.cpu_count() or 1) // NUM_BAG_FOLDS
+        fold_jobs = max(1, min(fold_jobs, len(splits)))
+        fold_kwargs = dict(
+            h_df=h_df, h_name=h_name, feature_cols=feature_cols, target_col=target_col,
+            col_pos=col_pos, time_limit=time_limit, purge=purge, embargo=embargo,
+        )
+        if fold_jobs == 1:
+            fold_results = []
+            pos_col_idx = None  # binary label encoding is shared by every fold of a horizon
+            for fold_i, (train_idx, val_idx) in enumerate(splits):
+                res = _train_fold(fold_i, len(splits), train_idx, val_idx,
+                                  pos_col_idx=pos_col_idx, **fold_kwargs)
+                if res is not None:
+                    pos_col_idx = res["pos_col_idx"]
+                fold_results.append(res)
+        else:
+            print(f"\n  Training {len(splits)} folds in parallel ({fold_jobs} jobs)")
+            print(f"  Live fold logs: {(MODEL_DIR / h_name).relative_to(ROOT)}/fold_*.log")
+            fold_kwargs.update(
+                num_cpus=max(1, (os.cpu_count() or 1) // fold_jobs),
+                max_memory_ratio=1.5 / fold_jobs,
             )
-
-            predictor.fit(
-                train_data=train_subset,
-                time_limit=time_limit,
-                presets=PRESETS,
-                num_gpus=0,
-                excluded_model_types=EXCLUDED,
-                num_bag_folds=NUM_BAG_FOLDS,
-                num_stack_levels=NUM_STACK_LEVELS,
-                dynamic_stacking=False,
-                ag_args_fit={
-                    "num_early_stopping_rounds": 50,
-                    "ag.max_memory_usage_ratio": 1.5,
-                },
-                ag_args_ensemble={
-                    "fold_fitting_strategy": "sequential_local",
-                },
+            # Generator output: each fold's log reaches this log as soon as it (and earlier folds) finish
+            outputs = Parallel(n_jobs=fold_jobs, backend="loky", return_as="generator")(
+                delayed(_run_captured)(MODEL_DIR / h_name / f"fold_{fold_i}.log", _train_fold,
+                                       fold_i, len(splits), train_idx, val_idx, **fold_kwargs)
+                for fold_i, (train_idx, val_idx) in enumerate(splits)
             )
+            fold_results = []
+            for fold_log, res in outputs:
+                print(fold_log, end="")
+                fold_results.append(res)
 
-            # Leaderboard
-            lb = predictor.leaderboard(val_subset, silent=True)
-            print(f"\n    Leaderboard (top 5):")
-            print(lb.head(5).to_string())
-
-            # Predictions — extract P(class=1)
-            preds_proba = predictor.predict_proba(val_subset[fold_features])
-            pos_label = 1
-            if pos_label in preds_proba.columns:
-                preds_np = preds_proba[pos_label].to_numpy()
-            elif str(pos_label) in preds_proba.columns:
-                preds_np = preds_proba[str(pos_label)].to_numpy()
-            else:
-                pos_idx = list(predictor.class_labels).index(pos_label)
-                preds_np = preds_proba.iloc[:, pos_idx].to_numpy()
-                print(f"    WARNING: used positional index {pos_idx}")
-
-            # Guardrails
-            assert 0 <= preds_np.min() and preds_np.max() <= 1, \
-                f"Probs out of [0,1]: {preds_np.min():.4f}-{preds_np.max():.4f}"
-
-            if fold_i == 0:
-                base = val_subset[target_col].mean()
-                pred_mean = preds_np.mean()
-                print(f"    base_rate={base:.4f}, pred_mean={pred_mean:.4f}")
-                if abs(pred_mean - (1 - base)) < abs(pred_mean - base):
-                    print(f"    WARNING: POSSIBLE PROBABILITY INVERSION!")
-
-            oof_preds.loc[val_data.index] = preds_np
-            # Track fold assignment for each OOF row
-            for idx in val_data.index:
-                fold_assignments.append((idx, fold_i))
-
-            # Fold metrics
-            actuals = val_subset[target_col].values
-            fold_auc = roc_auc_score(actuals, preds_np)
-            fold_acc = accuracy_score(actuals, (preds_np >= 0.5).astype(int))
-            fold_ic, _ = spearmanr(actuals, preds_np)
-            fold_brier = brier_score_loss(actuals, preds_np)
-            fold_ece, _ = expected_calibration_error(actuals, preds_np)
-            print(f"\n    AUC: {fold_auc:.4f}  Acc: {fold_acc:.4f}  IC: {fold_ic:.4f}  Brier: {fold_brier:.4f}  ECE: {fold_ece:.4f}")
-
-            fold_metrics.append({
-                "fold": fold_i,
-                "auc": float(fold_auc),
-                "acc": float(fold_acc),
-                "ic": float(fold_ic),
-                "brier": float(fold_brier),
-                "ece": float(fold_ece),
-                "n_val": len(val_data),
-            })
-
-            # Feature importance (permutation-based)
-            try:
-                imp = predictor.feature_importance(val_subset, silent=True)
-                fold_importances.append(imp)
-                top10 = imp.head(10)
-                print(f"    Top 10 features:")
-                for feat, row in top10.iterrows():
-                    tv = FEATURE_TV_MAP.get(feat, {}).get("indicator", "")
-                    tag = f" -> {tv}" if tv else ""
-                    print(f"      {feat:<35} {row['importance']:.4f}{tag}")
-            except Exception as e:
-                print(f"    Feature importance failed: {e}")
-
-            # Save fold metadata
-            fold_meta = {
-                "horizon": h_name,
-                "fold": fold_i,
-                "n_train": len(train_data),
-                "n_val": len(val_data),
-                "n_features": len(fold_features),
-                "features": fold_features,
-                "auc": float(fold_auc),
-                "acc": float(fold_acc),
-                "ic": float(fold_ic),
-                "brier": float(fold_brier),
-                "ece": float(fold_ece),
-                "purge": purge,
-                "embargo": embargo,
-            }
-            (fold_dir / "fold_meta.json").write_text(json.dumps(fold_meta, indent=2))
+        for res in fold_results:
+            if res is None:
+                continue
+            fold_i = res["fold"]
+            # Track feature stability
+            selected_ids.extend(feat_id[f] for f in res["features"])
+            oof_preds.loc[res["val_index"]] = res["preds"]
+            fold_id_arr[res["val_index"]] = fold_i
+            fold_metrics.append(res["metrics"])
+            if res["importance"] is not None:
+                fold_importances.append(res["importance"])
 
         # ── Feature stability report ──
         n_actual_folds = len(splits)
         if n_actual_folds > 0:
-            stability = {f: cnt / n_actual_folds for f, cnt in feature_selection_counts.items()}
-            n_all_folds = sum(1 for s in stability.values() if s >= 1.0)
-            n_unstable = sum(1 for s in stability.values() if s < 0.4)
+            counts = np.bincount(np.asarray(selected_ids, dtype=np.int64), minlength=len(feature_cols))
+            stability_arr = counts / n_actual_folds
+            n_all_folds = int((stability_arr >= 1.0).sum())
+            n_unstable = int(((stability_arr > 0) & (stability_arr < 0.4)).sum())
+            # Keyed in first-selection order so report ties keep their IC-rank order
+            stability = {feature_cols[i]: float(stability_arr[i]) for i in dict.fromkeys(selected_ids)}
             print(f"\n  Feature stability: {n_all_folds} in all folds, {n_unstable} unstable (<40%)")
             feature_stability_by_horizon[h_name] = stability
 
@@ -948,10 +1263,13 @@ def main():
         # ── Nested calibration: isotonic vs Platt ──
         print(f"\n  Calibrating probabilities (nested selection)...")
 
-        # Build fold assignment array aligned with OOF mask
-        fold_map = dict(fold_assignments)
-        oof_indices = h_df.index[mask]
-        oof_fold_ids = np.array([fold_map.get(idx, 0) for idx in oof_indices])
+        # Fold assignment aligned with OOF mask
+        oof_fold_ids = fold_id_arr[mask.to_numpy()]
+
+        # Calibrator inputs, built once: contiguous float64 (sklearn fits both calibrators in
+        # float64, and the pickled isotonic thresholds keep full precision for predict.py)
+        p64 = np.ascontiguousarray(oof_pred, dtype=np.float64)
+        p64_col = p64.reshape(-1, 1)
 
         # Split by fold parity: odd folds for fitting, even folds for evaluation
         odd_mask = (oof_fold_ids % 2 == 1)
@@ -960,14 +1278,14 @@ def main():
         if odd_mask.sum() > 50 and even_mask.sum() > 50:
             # Fit both candidates on odd folds
             iso_fit = IsotonicRegression(y_min=0.01, y_max=0.99, out_of_bounds='clip')
-            iso_fit.fit(oof_pred[odd_mask], oof_actual[odd_mask])
+            iso_fit.fit(p64[odd_mask], oof_actual[odd_mask])
 
             platt_fit = LogisticRegression(C=1e10, solver='lbfgs', max_iter=1000)
-            platt_fit.fit(oof_pred[odd_mask].reshape(-1, 1), oof_actual[odd_mask])
+            platt_fit.fit(p64_col[odd_mask], oof_actual[odd_mask])
 
             # Evaluate on even folds (blind)
-            iso_preds_eval = iso_fit.predict(oof_pred[even_mask])
-            platt_preds_eval = platt_fit.predict_proba(oof_pred[even_mask].reshape(-1, 1))[:, 1]
+            iso_preds_eval = iso_fit.predict(p64[even_mask])
+            platt_preds_eval = platt_fit.predict_proba(p64_col[even_mask])[:, 1]
 
             iso_ece, _ = expected_calibration_error(oof_actual[even_mask], iso_preds_eval)
             platt_ece, _ = expected_calibration_error(oof_actual[even_mask], platt_preds_eval)
@@ -984,12 +1302,12 @@ def main():
         # Refit winner on ALL OOF for production
         if cal_method == "isotonic":
             final_cal = IsotonicRegression(y_min=0.01, y_max=0.99, out_of_bounds='clip')
-            final_cal.fit(oof_pred, oof_actual)
-            oof_calibrated = final_cal.predict(oof_pred)
+            final_cal.fit(p64, oof_actual)
+            oof_calibrated = final_cal.predict(p64)
         else:
             final_cal = LogisticRegression(C=1e10, solver='lbfgs', max_iter=1000)
-            final_cal.fit(oof_pred.reshape(-1, 1), oof_actual)
-            oof_calibrated = final_cal.predict_proba(oof_pred.reshape(-1, 1))[:, 1]
+            final_cal.fit(p64_col, oof_actual)
+            oof_calibrated = final_cal.predict_proba(p64_col)[:, 1]
 
         calibrators[h_name] = {"calibrator": final_cal, "method": cal_method}
         final_ece, final_reliability = expected_calibration_error(oof_actual, oof_calibrated)
@@ -1002,30 +1320,30 @@ def main():
             "reliability": final_reliability,
         }
 
-        # Pre-calibration metrics
-        auc_raw = roc_auc_score(oof_actual, oof_pred)
+        # Pre/post-calibration AUC from one sort (calibration is monotone)
+        auc_raw, auc = oof_auc_pair(oof_actual, oof_pred, oof_calibrated)
+        if args.verify_calibration:
+            assert abs(roc_auc_score(oof_actual, oof_pred) - auc_raw) < 1e-9, "raw AUC mismatch"
+            assert abs(roc_auc_score(oof_actual, oof_calibrated) - auc) < 1e-9, "calibrated AUC mismatch"
         brier_raw = brier_score_loss(oof_actual, oof_pred)
 
         # Post-calibration metrics
-        auc = roc_auc_score(oof_actual, oof_calibrated)
-        acc = accuracy_score(oof_actual, (oof_calibrated >= 0.5).astype(int))
-        ic, ic_p = spearmanr(oof_actual, oof_calibrated)
+        # One correctness array shared by the overall / HC / VHC accuracies
+        correct = (oof_calibrated >= 0.5) == oof_actual.astype(bool)
+        acc = float(correct.mean())
+        ic, ic_p = binary_spearman(oof_actual, oof_calibrated)
         brier = brier_score_loss(oof_actual, oof_calibrated)
 
         # High-confidence accuracy (p > 0.55 or p < 0.45)
         hc_mask = (oof_calibrated >= 0.55) | (oof_calibrated <= 0.45)
-        hc_acc = accuracy_score(
-            oof_actual[hc_mask], (oof_calibrated[hc_mask] >= 0.5).astype(int)
-        ) if hc_mask.sum() > 0 else 0
         hc_n = int(hc_mask.sum())
+        hc_acc = float(correct[hc_mask].mean()) if hc_n > 0 else 0
         hc_pct = hc_n / len(oof_actual) * 100
 
         # Very-high-confidence accuracy (p > 0.58 or p < 0.42)
         vhc_mask = (oof_calibrated >= 0.58) | (oof_calibrated <= 0.42)
-        vhc_acc = accuracy_score(
-            oof_actual[vhc_mask], (oof_calibrated[vhc_mask] >= 0.5).astype(int)
-        ) if vhc_mask.sum() > 0 else 0
         vhc_n = int(vhc_mask.sum())
+        vhc_acc = float(correct[vhc_mask].mean()) if vhc_n > 0 else 0
         vhc_pct = vhc_n / len(oof_actual) * 100
 
         results[h_name] = {
@@ -1049,28 +1367,20 @@ def main():
         print(f"    n:         {len(oof_actual):,}")
 
         # Average feature importance across folds
+        # (mean over the folds that selected each feature)
         if fold_importances:
-            avg_imp = fold_importances[0].copy()
-            for fi in fold_importances[1:]:
-                avg_imp["importance"] = avg_imp["importance"].add(
-                    fi["importance"].reindex(avg_imp.index, fill_value=0)
-                )
-            avg_imp["importance"] /= len(fold_importances)
-            avg_imp = avg_imp.sort_values("importance", ascending=False)
+            cat = pd.concat([fi[["importance"]] for fi in fold_importances])
+            avg_imp = cat.groupby(level=0).mean().sort_values("importance", ascending=False)
             importance_by_horizon[h_name] = avg_imp
 
-        # Store OOF (calibrated) — merge back to original df via timestamp join
-        oof_col = f"oof_{h_name}"
-        oof_raw_col = f"oof_raw_{h_name}"
-        actual_col = f"actual_{h_name}"
-        h_oof = pd.DataFrame({
-            "timestamp": h_df.loc[mask, "timestamp"].values,
-            oof_col: oof_calibrated,
-            oof_raw_col: oof_pred,
-            actual_col: oof_actual,
-        })
-        oof_df = oof_df.drop(columns=[oof_col, oof_raw_col, actual_col], errors="ignore")
-        oof_df = oof_df.merge(h_oof, on="timestamp", how="left")
+        # Store OOF (calibrated) — scatter back to original df rows by position
+        oof_rows = h_src_pos[mask.to_numpy()]
+        for col, values in ((f"oof_{h_name}", oof_calibrated),
+                            (f"oof_raw_{h_name}", oof_pred),
+                            (f"actual_{h_name}", oof_actual)):
+            full = np.full(len(oof_df), np.nan)
+            full[oof_rows] = values
+            oof_df[col] = full
 
         # Save fold splits for reproducibility
         fold_splits_path = MODEL_DIR / h_name / "fold_splits.json"
@@ -1092,17 +1402,20 @@ def main():
     #  SAVE & REPORT
     # ══════════════════════════════════════════════════════════════════════════
 
-    # Save OOF predictions
+    # Save OOF predictions (columnar parquet — CSV float formatting dominated write time)
     OOF_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    oof_df.to_csv(OOF_OUTPUT, index=False)
+    oof_df.to_parquet(OOF_OUTPUT, engine="pyarrow", compression="zstd", use_dictionary=True, index=False)
     print(f"\nOOF saved: {OOF_OUTPUT}")
+    if args.legacy_csv:
+        oof_df.to_csv(OOF_OUTPUT.with_suffix(".csv"), index=False)
+        print(f"OOF saved: {OOF_OUTPUT.with_suffix('.csv')} (legacy CSV)")
 
     # Save calibrators
     for h_name, cal_info in calibrators.items():
         cal_path = MODEL_DIR / h_name / "calibrator.pkl"
         cal_path.parent.mkdir(parents=True, exist_ok=True)
         with open(cal_path, "wb") as f:
-            pickle.dump(cal_info, f)
+            pickle.dump(cal_info, f, protocol=5)
         print(f"  Calibrator saved: {cal_path} (method: {cal_info['method']})")
 
     # Generate TradingView setup guide
@@ -1192,6 +1505,8 @@ def main():
     print(f"  │        for full fold-by-fold diagnostics.               │")
     print(f"  └──────────────────────────────────────────────────────────┘")
 
+    sys.stdout.flush()
+    sys.stderr.flush()
     log_file.close()
     sys.stdout = sys.__stdout__
     sys.stderr = sys.__stderr__
@@ -10,11 +10,13 @@ Usage:
   python scripts/train-lean-directional.py --phase=2    # Phase 2 production (~4h)
 """
 
-import sys, warnings, shutil, argparse
+import sys, time, warnings, shutil, argparse
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 from scipy.stats import spearmanr
 from sklearn.metrics import roc_auc_score, accuracy_score
 
@@ -90,9 +92,21 @@ LEAN_FEATURES = [
     "hours_to_next_high_impact",
 ]
 
+# Integer-valued flags: int8 when null-free (float32 otherwise)
+INT8_FEATURES = [
+    "sqz_mom_positive", "sqz_state", "macd_hist_above_zero", "equity_bond_diverge",
+    "is_high_impact_day",
+]
+
+# Derived from timestamp at load time (same rules as build-lean-dataset.ts), never read from CSV
+TIME_FEATURES = ["hour_utc", "day_of_week", "is_us_session"]
+
 # ── Config ────────────────────────────────────────────────────────────────────
 
 DATASET_PATH = PROJECT_ROOT / "datasets" / "autogluon" / "mes_lean_fred_indexes_2020plus.csv"
+# Parquet cache of the typed, pruned, sorted load (<csv stem>.lean.parquet). Bump when
+# load_dataset's column set or dtypes change so older caches are re-parsed.
+CACHE_VERSION = "2"
 MODEL_DIR = PROJECT_ROOT / "models" / "lean_directional"
 OOF_OUTPUT = PROJECT_ROOT / "datasets" / "autogluon" / "lean_oof_1h.csv"
 
@@ -113,9 +127,70 @@ PHASE = {
 TIME_LIMIT = args.time_limit or PHASE["time_limit"]
 N_FOLDS = PHASE["folds"]
 
+# ── Data Loading ──────────────────────────────────────────────────────────────
+
+def add_time_features(df):
+    """hour_utc, day_of_week (0=Sunday, as JS getUTCDay) and is_us_session (13-21 UTC) as int8."""
+    ts = df["timestamp"]
+    ts = ts.dt.tz_localize("UTC") if ts.dt.tz is None else ts.dt.tz_convert("UTC")
+    hour = ts.dt.hour.to_numpy().astype(np.int8)
+    df["hour_utc"] = hour
+    df["day_of_week"] = ((ts.dt.dayofweek.to_numpy() + 1) % 7).astype(np.int8)
+    df["is_us_session"] = ((hour >= 13) & (hour < 21)).astype(np.int8)
+    return df
+
+
+def load_dataset(path):
+    """Read only timestamp + horizon targets + LEAN_FEATURES with Arrow's threaded CSV parser.
+
+    TIME_FEATURES are not read; add_time_features derives them from timestamp.
+    The typed, sorted result is cached next to the CSV as <stem>.lean.parquet (zstd)
+    and reused while it is newer than the CSV, was written by this CACHE_VERSION
+    and holds every wanted column.
+    Returns (df sorted by timestamp, number of columns in the CSV header).
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    targets = [cfg["target"] for cfg in HORIZONS.values()]
+    wanted = ["timestamp"] + targets + [f for f in LEAN_FEATURES if f not in TIME_FEATURES]
+    keep_cols = [c for c in dict.fromkeys(wanted) if c in header]
+
+    cache = path.with_name(path.stem + ".lean.parquet")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        schema = pq.read_schema(cache)
+        if ((schema.metadata or {}).get(b"lean_cache_version") == CACHE_VERSION.encode()
+                and set(keep_cols) <= set(schema.names)):
+            print(f"  Using parquet cache {cache.name}")
+            df = pd.read_parquet(cache, columns=keep_cols, engine="pyarrow")
+            return add_time_features(df), len(header)
+
+    tbl = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 22),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=keep_cols,
+            column_types={c: pa.float32() for c in keep_cols if c != "timestamp"},
+        ),
+    )
+    df = tbl.to_pandas(self_destruct=True)
+    # Arrow parses ISO-8601 timestamps natively; anything else falls back to a cached pandas parse
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, cache=True)
+    # Append-only bar data is normally already in order: O(n) check, sort only if needed
+    if not df["timestamp"].is_monotonic_increasing:
+        df = df.sort_values("timestamp", kind="stable", ignore_index=True)
+    # Binary targets join the int8 set once null-free (unlabeled tail rows keep them float32)
+    flags = [c for c in INT8_FEATURES + targets if c in df.columns and not df[c].isna().any()]
+    df[flags] = df[flags].astype(np.int8)
+    out = pa.Table.from_pandas(df, preserve_index=False)
+    out = out.replace_schema_metadata({**(out.schema.metadata or {}), b"lean_cache_version": CACHE_VERSION.encode()})
+    pq.write_table(out, cache, compression="zstd", row_group_size=8192)
+    return add_time_features(df), len(header)
+
+
 # ── Walk-Forward Splitter ─────────────────────────────────────────────────────
 
 def walk_forward_splits(n, n_folds, purge, embargo):
+    """(train, val) row ranges as slice objects — use with df.iloc[sl], no index lists built."""
     fold_size = n // (n_folds + 1)
     splits = []
     for fold in range(n_folds):
@@ -123,7 +198,7 @@ def walk_forward_splits(n, n_folds, purge, embargo):
         val_start = split + purge + embargo
         val_end = fold_size * (fold + 2) if fold < n_folds - 1 else n
         if val_start < val_end and val_start < n:
-            splits.append((list(range(0, split)), list(range(val_start, val_end))))
+            splits.append((slice(0, split), slice(val_start, val_end)))
     return splits
 
 
@@ -135,14 +210,14 @@ def main():
     # Log setup
     log_dir = PROJECT_ROOT / "models" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S", time.gmtime())  # UTC, matches dataset timestamps
     log_path = log_dir / f"lean_{ts}.log"
 
-    log_file = open(log_path, "w", buffering=1)
+    log_file = open(log_path, "w", buffering=1)  # line-buffered: no per-write flush needed
     class Tee:
         def __init__(self, *s): self.streams = s
         def write(self, d):
-            for s in self.streams: s.write(d); s.flush()
+            for s in self.streams: s.write(d)
         def flush(self):
             for s in self.streams: s.flush()
         def isatty(self): return False
@@ -152,9 +227,8 @@ def main():
 
     # Load data
     print(f"\nLoading {DATASET_PATH.name}...")
-    df = pd.read_csv(DATASET_PATH)
-    df = df.sort_values("timestamp").reset_index(drop=True)
-    print(f"  Raw: {len(df):,} rows x {len(df.columns)} cols")
+    df, n_csv_cols = load_dataset(DATASET_PATH)
+    print(f"  Raw: {len(df):,} rows x {len(df.columns)} of {n_csv_cols} cols")
 
     # Validate features exist
     available = [f for f in LEAN_FEATURES if f in df.columns]
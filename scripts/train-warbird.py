@@ -46,8 +46,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.spatial.distance import squareform
-from scipy.stats import norm, spearmanr
+from scipy.stats import norm, rankdata, spearmanr
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score, roc_auc_score
 
 
@@ -196,53 +195,103 @@ def pinball_loss(y_true: np.ndarray, y_pred_q: np.ndarray, q: float) -> float:
     return float(np.mean(np.maximum(q * err, (q - 1.0) * err)))
 
 
-def rank_features_by_ic(train_df: pd.DataFrame, feature_cols: list[str], target_col: str, top_n: int) -> list[str]:
-    ranked: list[tuple[str, float]] = []
-    for col in feature_cols:
-        if col not in train_df.columns:
-            continue
-        s = train_df[[col, target_col]].dropna()
-        if len(s) < 100:
-            ranked.append((col, 0.0))
+def rank_block(train_df: pd.DataFrame, feature_cols: list[str], target_col: str) -> tuple[pd.DataFrame, pd.Series]:
+    """Average ranks (float32) of numeric features over rows with a target, computed once per fold.
+
+    Returns the ranks and the matching (unranked) target; spearman_ics ranks the
+    target per feature NaN pattern.
+    """
+    numeric = [c for c in feature_cols if c in train_df.columns and pd.api.types.is_numeric_dtype(train_df[c])]
+    valid = train_df[target_col].notna()
+    ranks_df = train_df.loc[valid, numeric].rank(method="average").astype(np.float32)
+    return ranks_df, train_df.loc[valid, target_col]
+
+
+def _nan_pattern_groups(x: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Columns of x grouped by identical NaN pattern, as (valid-row mask, column indices)."""
+    valid = ~np.isnan(x)
+    patterns, inverse = np.unique(valid.T, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    return [(patterns[g], np.flatnonzero(inverse == g)) for g in range(len(patterns))]
+
+
+def _pearson_cols(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pearson r between every column of a and every column of b (no NaNs), as one matmul."""
+    a = a - a.mean(axis=0)
+    b = b - b.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (a.T @ b) / np.sqrt(np.outer((a * a).sum(axis=0), (b * b).sum(axis=0)))
+
+
+def _spearman_corr(x: np.ndarray) -> np.ndarray:
+    """Spearman matrix of rank columns with pandas' pairwise-complete semantics.
+
+    Columns sharing a NaN pattern reuse their ranks; pairs with different patterns
+    are re-ranked on the rows both have, like DataFrame.corr(method="spearman").
+    """
+    corr = np.full((x.shape[1], x.shape[1]), np.nan)
+    groups = _nan_pattern_groups(x)
+    for i, (rows_a, cols_a) in enumerate(groups):
+        for rows_b, cols_b in groups[i:]:
+            rows = rows_a & rows_b
+            if rows.sum() < 2:
+                continue
+            a = x[np.ix_(rows, cols_a)]
+            b = x[np.ix_(rows, cols_b)]
+            if not np.array_equal(rows, rows_a):
+                a = rankdata(a, axis=0)
+            if not np.array_equal(rows, rows_b):
+                b = rankdata(b, axis=0)
+            block = _pearson_cols(a, b)
+            corr[np.ix_(cols_a, cols_b)] = block
+            corr[np.ix_(cols_b, cols_a)] = block.T
+    return corr
+
+
+def spearman_ics(ranks_df: pd.DataFrame, target: pd.Series, feature_cols: list[str]) -> dict[str, float]:
+    """|Spearman IC| per feature; <100 valid rows scores 0.
+
+    The target is ranked once per feature NaN pattern, over exactly that pattern's
+    rows, so each IC equals spearmanr on the feature's complete pairs.
+    """
+    x = ranks_df.to_numpy(dtype=np.float64)
+    y = target.to_numpy(dtype=np.float64)
+    ic = np.zeros(x.shape[1])
+    for rows, cols in _nan_pattern_groups(x):
+        if rows.sum() < 100:
             continue
-        try:
-            ic, _ = spearmanr(s[col], s[target_col])
-            ranked.append((col, abs(float(ic)) if np.isfinite(ic) else 0.0))
-        except Exception:
-            ranked.append((col, 0.0))
-    ranked.sort(key=lambda x: -x[1])
+        r = _pearson_cols(x[np.ix_(rows, cols)], rankdata(y[rows])[:, None])[:, 0]
+        ic[cols] = np.where(np.isfinite(r), np.abs(r), 0.0)
+    by_col = dict(zip(ranks_df.columns, ic.tolist()))
+    return {c: by_col.get(c, 0.0) for c in feature_cols}
+
+
+def rank_features_by_ic(ics: dict[str, float], top_n: int) -> list[str]:
+    ranked = sorted(ics.items(), key=lambda x: -x[1])
     return [c for c, _ in ranked[:top_n]]
 
 
 def cluster_dedup_features(
-    df: pd.DataFrame,
+    ranks_df: pd.DataFrame,
     feature_cols: list[str],
-    target_col: str,
+    ics: dict[str, float],
     corr_threshold: float,
 ) -> list[str]:
-    numeric = [c for c in feature_cols if pd.api.types.is_numeric_dtype(df[c])]
+    numeric = [c for c in feature_cols if c in ranks_df.columns]
     if len(numeric) < 2:
         return feature_cols
 
-    ics: dict[str, float] = {}
-    for c in numeric:
-        s = df[[c, target_col]].dropna()
-        if len(s) < 100:
-            ics[c] = 0.0
-            continue
-        ic, _ = spearmanr(s[c], s[target_col])
-        ics[c] = abs(float(ic)) if np.isfinite(ic) else 0.0
-
-    corr = df[numeric].corr(method="spearman").abs().fillna(0.0).to_numpy()
-    np.fill_diagonal(corr, 1.0)
-    dist = np.clip(1.0 - corr, 0.0, 2.0)
-    z = linkage(squareform(dist, checks=False), method="average")
+    corr = _spearman_corr(ranks_df[numeric].to_numpy(dtype=np.float64))
+    # Condensed (upper-triangle) distances straight from corr — no square dist matrix
+    iu = np.triu_indices(len(numeric), k=1)
+    condensed = np.clip(1.0 - np.nan_to_num(np.abs(corr[iu]), nan=0.0), 0.0, 2.0)
+    z = linkage(condensed, method="average")
     clusters = fcluster(z, t=(1.0 - corr_threshold), criterion="distance")
 
     selected: set[str] = set()
     for cid in set(clusters):
         members = [numeric[i] for i in range(len(numeric)) if clusters[i] == cid]
-        best = max(members, key=lambda c: (ics.get(c, 0.0), -df[c].isna().sum()))
+        best = max(members, key=lambda c: (ics.get(c, 0.0), -ranks_df[c].isna().sum()))
         selected.add(best)
 
     kept = [c for c in feature_cols if (c in selected) or (c not in numeric)]
@@ -506,13 +555,14 @@ def main() -> None:
                 if len(train_df) < 300 or len(val_df) < 30:
                     continue
 
-                ranked = rank_features_by_ic(
-                    train_df, feature_cols, target_col, top_n=max(args.feature_top_n * 4, args.feature_top_n)
-                )
+                # Rank once per fold; IC screening and cluster dedup both reuse these ranks
+                ranks_df, target = rank_block(train_df, feature_cols, target_col)
+                ics = spearman_ics(ranks_df, target, feature_cols)
+                ranked = rank_features_by_ic(ics, top_n=max(args.feature_top_n * 4, args.feature_top_n))
                 deduped = cluster_dedup_features(
-                    train_df,
+                    ranks_df,
                     ranked,
-                    target_col,
+                    ics,
                     corr_threshold=args.feature_corr_threshold,
                 )
                 selected = deduped[: args.feature_top_n]
@@ -2,42 +2,45 @@
 verify-finance-stack.py
 
 Smoke-tests all requested finance packages and prints an auditable JSON report.
+Missing packages are reported as "missing" and make the script exit 1.
 """
 
 from __future__ import annotations
 
 import json
+import re
 import sys
-from importlib.metadata import version, PackageNotFoundError
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from importlib.metadata import distributions
+
+
+def _canonical(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@lru_cache(maxsize=None)
+def _installed_versions() -> dict[str, str]:
+    # One sys.path scan for every distribution; first match wins, as with version()
+    versions: dict[str, str] = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if name:
+            versions.setdefault(_canonical(name), dist.version)
+    return versions
 
 
 def package_version(name: str) -> str:
-    try:
-        return version(name)
-    except PackageNotFoundError:
-        return "not-installed"
-
-
-def run_checks() -> dict[str, object]:
-    report: dict[str, object] = {
-        "python": sys.version.split()[0],
-        "packages": {
-            "scipy": package_version("scipy"),
-            "statsmodels": package_version("statsmodels"),
-            "quandl": package_version("Quandl"),
-            "QuantLib": package_version("QuantLib"),
-            "zipline-reloaded": package_version("zipline-reloaded"),
-            "pyfolio-reloaded": package_version("pyfolio-reloaded"),
-        },
-        "checks": {},
-    }
-
-    # SciPy
+    return _installed_versions().get(_canonical(name), "not-installed")
+
+
+def check_scipy(checks: dict[str, object]) -> None:
     from scipy.stats import norm
 
-    report["checks"]["scipy_norm_cdf_0"] = float(norm.cdf(0.0))
+    checks["scipy_norm_cdf_0"] = float(norm.cdf(0.0))
 
-    # statsmodels
+
+def check_statsmodels(checks: dict[str, object]) -> None:
     import numpy as np
     import statsmodels.api as sm
 
@@ -45,38 +48,81 @@ def run_checks() -> dict[str, object]:
     x = np.array([1.0, 2.0, 3.0, 4.0])
     x_const = sm.add_constant(x)
     ols = sm.OLS(y, x_const).fit()
-    report["checks"]["statsmodels_r2"] = float(ols.rsquared)
+    checks["statsmodels_r2"] = float(ols.rsquared)
+
 
-    # Quandl
+def check_quandl(checks: dict[str, object]) -> None:
     import quandl
 
-    report["checks"]["quandl_has_get"] = hasattr(quandl, "get")
+    checks["quandl_has_get"] = hasattr(quandl, "get")
+
 
-    # QuantLib
+def check_quantlib(checks: dict[str, object]) -> None:
     import QuantLib as ql
 
-    report["checks"]["quantlib_business_day"] = ql.Date(15, 1, 2026).weekday()
+    checks["quantlib_business_day"] = ql.Date(15, 1, 2026).weekday()
 
+
+def check_zipline(checks: dict[str, object]) -> None:
     # Zipline-reloaded exports as zipline module
     import zipline
 
-    report["checks"]["zipline_version"] = getattr(zipline, "__version__", "unknown")
+    checks["zipline_version"] = getattr(zipline, "__version__", "unknown")
+
 
+def check_pyfolio(checks: dict[str, object]) -> None:
     # Pyfolio-reloaded exports as pyfolio module
     import pyfolio
     import pandas as pd
 
-    report["checks"]["pyfolio_version"] = getattr(pyfolio, "__version__", "unknown")
+    checks["pyfolio_version"] = getattr(pyfolio, "__version__", "unknown")
     sample_rets = pd.Series([0.01, -0.005, 0.002], index=pd.date_range("2026-01-01", periods=3, freq="D"))
     stats = pyfolio.timeseries.perf_stats(sample_rets)
-    report["checks"]["pyfolio_perf_stats_rows"] = int(stats.shape[0])
+    checks["pyfolio_perf_stats_rows"] = int(stats.shape[0])
+
+
+# (report key, distribution name, primary check key, check) — imports stay inside each check
+CHECKS = [
+    ("scipy", "scipy", "scipy_norm_cdf_0", check_scipy),
+    ("statsmodels", "statsmodels", "statsmodels_r2", check_statsmodels),
+    ("quandl", "Quandl", "quandl_has_get", check_quandl),
+    ("QuantLib", "QuantLib", "quantlib_business_day", check_quantlib),
+    ("zipline-reloaded", "zipline-reloaded", "zipline_version", check_zipline),
+    ("pyfolio-reloaded", "pyfolio-reloaded", "pyfolio_version", check_pyfolio),
+]
+
+
+@dataclass
+class Report:
+    python: str
+    packages: dict[str, str]
+    checks: dict[str, object] = field(default_factory=dict)
+
+
+def run_checks() -> Report:
+    report = Report(
+        python=sys.version.split()[0],
+        packages={key: package_version(dist) for key, dist, _, _ in CHECKS},
+    )
+
+    for key, _, check_key, check in CHECKS:
+        # Not installed: report it without paying for the (possibly heavy) import attempt
+        if report.packages[key] == "not-installed":
+            report.checks[check_key] = "missing"
+            continue
+        try:
+            check(report.checks)
+        except ImportError:
+            report.checks[check_key] = "missing"
 
     return report
 
 
 def main() -> None:
     report = run_checks()
-    print(json.dumps(report, indent=2, sort_keys=True))
+    print(json.dumps(asdict(report), indent=2, sort_keys=True))
+    if any(value == "missing" for value in report.checks.values()):
+        sys.exit(1)
 
 
 if __name__ == "__main__":